@@ -3,7 +3,6 @@ from collections import defaultdict
 from functools import cached_property
 from typing import Generic, List, Tuple
 
-from ._collections import group_by_key
 from ._typing import (
     Edges,
     Height,
@@ -36,15 +35,17 @@ class Graph(Generic[NodeType]):
 
     @cached_property
     def node_heights(self) -> NodeHeights[NodeType]:
-        mapping: NodeHeights[NodeType] = {}
-        for node in self.nodes:
-            self._node_height(mapping, node)
-        return mapping
+        return _heights_from(self.nodes, self.edges)
+
+    @cached_property
+    def reverse_node_heights(self) -> NodeHeights[NodeType]:
+        """Node heights of the graph with reversed edges."""
+        return _heights_from(self.nodes, self._reverse_adjacency)
 
     @cached_property
     def height_groups(self) -> HeightGroups[NodeType]:
         heights = self.node_heights
-        reverse_heights = self.reverse_edges().node_heights
+        reverse_heights = self.reverse_node_heights
 
         def score(node: NodeType) -> int:
             return heights.get(node, 0) + reverse_heights.get(node, 0)
@@ -56,17 +57,23 @@ class Graph(Generic[NodeType]):
             )
 
         # Group nodes by height.
-        groupings = group_by_key((height, node)
-                                 for node, height in heights.items())
+        groupings: HeightGroups[NodeType] = defaultdict(list)
+        for node, height in heights.items():
+            groupings[height].append(node)
 
         # Within each height, sort by reverse heights.
         height_groups = {
             height: sorted_group(group)
-            for height, group in groupings
+            for height, group in groupings.items()
         }
 
         return height_groups
 
+    @cached_property
+    def max_height(self) -> Height:
+        """Height of the highest node in the graph."""
+        return max(self.height_groups)
+
     def has_edge(self, pair: Tuple[NodeType, NodeType]) -> bool:
         return pair[1] in self.edges.get(pair[0], {})
 
@@ -78,11 +85,18 @@ class Graph(Generic[NodeType]):
 
     def reverse_edges(self) -> 'Graph[NodeType]':
         """Return a graph with reversed edges."""
-        edges = defaultdict(set)
+        edges = {dest: set(sources)
+                 for dest, sources in self._reverse_adjacency.items()}
+        return Graph(nodes=self.nodes, edges=edges)
+
+    @cached_property
+    def _reverse_adjacency(self) -> Edges[NodeType]:
+        # Mapping of a node to the set of nodes with an edge to it.
+        edges: Edges[NodeType] = defaultdict(set)
         for src, destinations in self.edges.items():
             for dest in destinations:
                 edges[dest].add(src)
-        return Graph(nodes=self.nodes, edges=dict(edges))
+        return dict(edges)
 
     def _init_nodes(self):
         # We may not have received all nodes, add empty node labels.
@@ -93,27 +107,6 @@ class Graph(Generic[NodeType]):
                 if neighbor not in self.nodes:
                     self.nodes[neighbor] = ''
 
-    def _node_height(self, mapping: NodeHeights[NodeType],
-                     node: NodeType, depth: int = 0) -> Height:
-        # Return the node's height in this graph.
-        #
-        # The node's height equals to the longest path we can walk
-        # starting from the node.
-        #
-        # This method changes argument mapping to update the walk over
-        # the graph, and return the node's height.
-        if node in mapping:
-            return mapping[node]
-
-        height = 0
-        if node in self.edges:
-            height = 1 + max(self._node_height(mapping, neighbor,
-                                               depth=depth+1)
-                             for neighbor in self.edges[node])
-
-        mapping[node] = Height(height)
-        return Height(height)
-
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Graph):
             return False
@@ -121,3 +114,49 @@ class Graph(Generic[NodeType]):
 
     def __repr__(self) -> str:
         return f'Graph(nodes={self.nodes!r}, edges={self.edges!r})'
+
+
+def _heights_from(nodes: Nodes[NodeType],
+                  edges: Edges[NodeType]) -> NodeHeights[NodeType]:
+    # Return the height of every node walking the given edges.
+    #
+    # The node's height equals to the longest path we can walk
+    # starting from the node.  The walk is an iterative post-order
+    # traversal, so deep graphs do not hit the recursion limit.
+    # Nodes are recorded as the walk finishes them, which keeps the
+    # mapping ordering the height groups rely on to break ties.
+    mapping: NodeHeights[NodeType] = {}
+
+    for node in nodes:
+        if node in mapping:
+            continue
+
+        stack = [(node, iter(edges.get(node, ())))]
+        on_stack = {node}
+        # Heights of the children visited so far for each frame.
+        result_stack: List[List[Height]] = [[]]
+
+        while stack:
+            current, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor in mapping:
+                    result_stack[-1].append(mapping[neighbor])
+                elif neighbor in on_stack:
+                    raise ValueError('graph has a cycle')
+                else:
+                    stack.append((neighbor, iter(edges.get(neighbor, ()))))
+                    on_stack.add(neighbor)
+                    result_stack.append([])
+                    break
+            else:
+                # All neighbors were visited.
+                stack.pop()
+                on_stack.discard(current)
+                child_heights = result_stack.pop()
+                height = Height(1 + max(child_heights)
+                                if child_heights else 0)
+                mapping[current] = height
+                if result_stack:
+                    result_stack[-1].append(height)
+
+    return mapping
@@ -1,7 +1,8 @@
 """Graph rendering for Graphviz's DOT file and pydot."""
 from collections import defaultdict
-from typing import Dict, IO, Set
+from typing import Dict, IO, List, Set, Tuple
 import logging
+import re
 
 import pydot
 
@@ -10,13 +11,17 @@ from ._render import Renderer
 from ._typing import Edges, Nodes, NodeType
 
 
-def render_from_dot_filename(filename: str) -> str:
+def render_from_dot_filename(filename: str,
+                             use_fast_parser: bool = True) -> str:
     """Render a DAG from an input in Graphviz's DOT format.
 
     Parameters
     ----------
     filename : str
         The filename of a DOT file to be read.
+    use_fast_parser : bool
+        Whether to read the file with the built-in scanner instead of
+        pydot.  See `render_from_dot_file`.
 
     Returns
     -------
@@ -25,16 +30,23 @@ def render_from_dot_filename(filename: str) -> str:
 
     """
     with open(filename, 'rt') as dot_file:
-        return render_from_dot_file(dot_file)
+        return render_from_dot_file(dot_file, use_fast_parser)
 
 
-def render_from_dot_file(input: IO) -> str:
+def render_from_dot_file(input: IO, use_fast_parser: bool = True) -> str:
     """Render a DAG from an input in Graphviz's DOT format.
 
     Parameters
     ----------
     input :file-like
         A file-like object from which the graph will be read.
+    use_fast_parser : bool
+        Whether to read the graph with the built-in scanner before
+        trying pydot.  The scanner is much faster than pydot's full DOT
+        grammar but only understands a single `digraph` made of node,
+        edge and attribute statements.  Graphs using anything else,
+        such as subgraphs, ports or undirected edges, are read with
+        pydot.
 
     Returns
     -------
@@ -42,7 +54,19 @@ def render_from_dot_file(input: IO) -> str:
         The string representation of the graph.
 
     """
-    graphs = pydot.graph_from_dot_data(input.read())
+    data = input.read()
+    if use_fast_parser:
+        try:
+            nodes, edges = _scan_dot(data)
+        except ValueError as error:
+            _LOGGER.debug('Reading the DOT file with pydot: %s.', error)
+        else:
+            return _render(nodes, edges)
+
+    # pyparsing's packrat cache is deliberately left disabled: with
+    # pydot's grammar it makes parsing slower, not faster (about 3x
+    # slower on the Inception V3 sample with an unbounded cache).
+    graphs = pydot.graph_from_dot_data(data)
     if len(graphs) != 1:
         _LOGGER.warning(
             'Read %d graphs from a DOT file, rendering only the first.',
@@ -51,6 +75,15 @@ def render_from_dot_file(input: IO) -> str:
 
 
 def render_from_dot_graph(graph: pydot.Dot) -> str:
+    if _HAS_OBJ_DICT:
+        nodes, edges = _read_obj_dict(graph)
+    else:
+        nodes, edges = _read_graph(graph)
+    return _render(nodes, edges)
+
+
+def _read_graph(graph: pydot.Dot) -> Tuple[Nodes[str], Edges[str]]:
+    # Extract node labels and edges through pydot's public API.
     nodes: Nodes[str] = {}
     for node in graph.get_nodes():
         attrs = node.get_attributes()
@@ -65,9 +98,206 @@ def render_from_dot_graph(graph: pydot.Dot) -> str:
         destination = edge.get_destination()
         edges[source].add(destination)
 
-    dag = Graph(nodes=nodes, edges=dict(edges))
+    return nodes, dict(edges)
+
+
+def _read_obj_dict(graph: pydot.Dot) -> Tuple[Nodes[str], Edges[str]]:
+    # Extract node labels and edges reading pydot's internal
+    # dictionaries, skipping the creation of a Node or Edge object and
+    # the accessor calls for each item.
+    nodes: Nodes[str] = {}
+    for name, node_dicts in graph.obj_dict['nodes'].items():
+        for node_dict in node_dicts:
+            label = node_dict['attributes'].get('label')
+            if label is not None:
+                nodes[name] = label.strip('"')
+
+    edges: Edges[str] = defaultdict(set)
+    for source, destination in graph.obj_dict['edges']:
+        edges[source].add(destination)
+
+    return nodes, dict(edges)
+
+
+def _has_obj_dict_layout() -> bool:
+    # Return whether pydot stores nodes and edges the way
+    # _read_obj_dict expects.
+    try:
+        graph = pydot.Dot()
+        graph.add_node(pydot.Node('a', label='"a"'))
+        graph.add_edge(pydot.Edge('a', 'b'))
+        return (_read_obj_dict(graph) == _read_graph(graph)
+                == ({'a': 'a'}, {'a': {'b'}}))
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return False
+
+
+def _render(nodes: Nodes[str], edges: Edges[str]) -> str:
+    dag = Graph(nodes=nodes, edges=edges)
     renderer = Renderer(dag)
     return renderer.to_string()
 
 
+def _scan_dot(text: str) -> Tuple[Nodes[str], Edges[str]]:
+    # Extract node labels and edges from a DOT document.
+    #
+    # Raise ValueError on anything outside the DOT subset read by
+    # _DotScanner, so that the caller can fall back to pydot.
+    return _DotScanner(text).scan()
+
+
+class _DotScanner:
+    # Reader of a single digraph made of node, edge and attribute
+    # statements.  Names and labels are kept as pydot reads them.
+
+    def __init__(self, text: str) -> None:
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        self.nodes: Nodes[str] = {}
+        self.edges: Edges[str] = defaultdict(set)
+
+    def scan(self) -> Tuple[Nodes[str], Edges[str]]:
+        self._accept_keyword('strict')
+        if not self._accept_keyword('digraph'):
+            raise ValueError('only digraphs are supported')
+        if self._peek() == _ID:
+            # Graph name.
+            self.pos += 1
+        self._expect('{')
+        while not self._accept('}'):
+            self._statement()
+        if self.pos != len(self.tokens):
+            raise ValueError('only a single graph is supported')
+        return self.nodes, dict(self.edges)
+
+    def _statement(self) -> None:
+        kind, name = self._next()
+        if kind == ';':
+            return
+        if kind != _ID or name.lower() in _UNSUPPORTED_KEYWORDS:
+            raise ValueError(f'unsupported statement at {name!r}')
+
+        if name.lower() in _ATTRIBUTE_KEYWORDS:
+            # pydot reads a default label as a node named after the
+            # keyword, leave it to pydot.
+            if 'label' in self._attributes():
+                raise ValueError(f'unsupported default label in {name!r}')
+        elif self._accept('='):
+            # Graph attribute, such as `rankdir=LR`.
+            self._expect(_ID)
+        elif self._peek() in ('->', '--'):
+            self._edges(name)
+        else:
+            self._check_port()
+            label = self._attributes().get('label')
+            if label is not None:
+                self.nodes[name] = label.strip('"')
+
+    def _edges(self, source: str) -> None:
+        # Read a chain of edges such as `a -> b -> c`.
+        while True:
+            self._check_port()
+            kind = self._peek()
+            if kind == '--':
+                raise ValueError('undirected edges are not supported')
+            if kind != '->':
+                break
+            self.pos += 1
+            destination = self._expect(_ID)
+            self.edges[source].add(destination)
+            source = destination
+        self._attributes()
+
+    def _attributes(self) -> Dict[str, str]:
+        # Read the attribute lists following a statement, if any.
+        attributes = {}
+        while self._accept('['):
+            while not self._accept(']'):
+                key = self._expect(_ID)
+                if self._accept('='):
+                    attributes[key] = self._expect(_ID)
+                if not self._accept(','):
+                    self._accept(';')
+        return attributes
+
+    def _check_port(self) -> None:
+        if self._peek() == ':':
+            raise ValueError('ports are not supported')
+
+    def _peek(self) -> str:
+        # Return the kind of the next token.
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos][0]
+        return ''
+
+    def _next(self) -> Tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise ValueError('unexpected end of the graph')
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _accept(self, kind: str) -> bool:
+        if self._peek() == kind:
+            self.pos += 1
+            return True
+        return False
+
+    def _accept_keyword(self, keyword: str) -> bool:
+        if (self._peek() == _ID
+                and self.tokens[self.pos][1].lower() == keyword):
+            self.pos += 1
+            return True
+        return False
+
+    def _expect(self, kind: str) -> str:
+        token_kind, value = self._next()
+        if token_kind != kind:
+            raise ValueError(f'expected {kind!r}, found {value!r}')
+        return value
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    # Return the (kind, value) tokens of a DOT document.  The kind of
+    # an identifier is _ID, and of other tokens their own text.
+    tokens = []
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        if kind == 'space':
+            continue
+        value = match.group()
+        if kind == 'id':
+            if value.startswith('"'):
+                # Drop line continuations, as pydot does.
+                value = _CONTINUATION_RE.sub('', value)
+            tokens.append((_ID, value))
+        elif kind == 'symbol':
+            tokens.append((value, value))
+        else:
+            raise ValueError(f'unsupported character {value!r}')
+    return tokens
+
+
+_ID = 'ID'
+"""Token kind of an identifier: a name, a numeral or a quoted string."""
+
+_TOKEN_RE = re.compile(r'''
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/|^\#[^\n]*)
+  | (?P<id>"(?:[^"\\]|\\.)*"|[^\W\d]\w*|-?(?:\.\d+|\d+(?:\.\d*)?))
+  | (?P<symbol>->|--|[][{};,=:])
+  | (?P<error>.)
+''', re.M | re.S | re.X)
+"""Matches a DOT token, or any character starting no token."""
+
+_CONTINUATION_RE = re.compile(r'\\\r?\n')
+"""Matches a line continuation inside a quoted string."""
+
+_ATTRIBUTE_KEYWORDS = frozenset(['node', 'edge', 'graph'])
+
+_UNSUPPORTED_KEYWORDS = frozenset(['digraph', 'strict', 'subgraph'])
+
+
 _LOGGER = logging.getLogger(__name__)
+
+_HAS_OBJ_DICT = _has_obj_dict_layout()
+"""Whether pydot graphs can be read through their internal dictionaries."""
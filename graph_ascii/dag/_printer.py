@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from typing import List, Tuple
 
+from ._symbol import SymbolType
 from ._typing import RenderedGraph, SymbolRow
 from ._string import longest_common_prefix, longest_common_suffix
 
@@ -93,6 +94,8 @@ class _RowPrinter:
         self.output: List[str] = []
         self.labels: List[str] = []
         self.max_size = max_size
+        # Number of characters written by _print_symbols.
+        self._used_chars = 0
         if options.spacing == Spacing.FIXED:
             self._print_spacing = self._print_fixed_spacing
         elif options.spacing == Spacing.JUSTIFIED:
@@ -113,30 +116,34 @@ class _RowPrinter:
         return ''.join(self.output)
 
     def _print_symbols(self):
-        for symbol in self.row:
-            if symbol.is_node:
-                self.labels.append(symbol.label)
-            self.output.append(symbol.to_char())
+        # Joining the one-character strings is about twice as fast as
+        # writing ord(char) into a bytearray and decoding it.
+        symbols = ''.join([symbol.char for symbol in self.row])
+        if SymbolType.NODE.char in symbols:
+            # Only rows with nodes have labels to collect.
+            self.labels.extend(symbol.label
+                               for symbol in self.row
+                               if symbol.symbol_type is SymbolType.NODE)
+        self.output.append(symbols)
+        self._used_chars = len(symbols)
 
     def _print_fixed_spacing(self):
         self.output.append(' ' * self.options.spaces)
 
     def _print_justified_spacing(self):
-        used_chars = sum(len(w) for w in self.output)
-        if used_chars == 0:
+        if self._used_chars == 0:
             return
 
-        needed_spaces = self.options.spaces - used_chars
+        needed_spaces = self.options.spaces - self._used_chars
 
         self.output.append(' ' * max(1, needed_spaces))
 
     def _print_auto_justified_spacing(self):
-        used_chars = sum(len(w) for w in self.output)
-        if used_chars == 0:
+        if self._used_chars == 0:
             return
 
         alignment = self.max_size + self.options.spaces
-        needed_spaces = alignment - used_chars
+        needed_spaces = alignment - self._used_chars
 
         self.output.append(' ' * max(0, needed_spaces))
 
@@ -157,6 +164,13 @@ class _RowPrinter:
                 and len(self.labels) >= self.options.min_group_size):
             return ('', labels)
 
+        # Cheap rejections before computing the common prefix.
+        min_length = min(len(label) for label in labels)
+        if min_length < self.options.prefix_min_length:
+            return ('', labels)
+        if len({label[:1] for label in labels}) > 1:
+            return ('', labels)
+
         prefix = longest_common_prefix(labels)
 
         prefix_len = len(prefix)
@@ -170,6 +184,13 @@ class _RowPrinter:
                 and len(self.labels) >= self.options.min_group_size):
             return (labels, '')
 
+        # Cheap rejections before computing the common suffix.
+        min_length = min(len(label) for label in labels)
+        if min_length < self.options.suffix_min_length:
+            return (labels, '')
+        if len({label[-1:] for label in labels}) > 1:
+            return (labels, '')
+
         suffix = longest_common_suffix(labels)
 
         suffix_len = len(suffix)
@@ -1,12 +1,8 @@
 """Graph renderer."""
 from dataclasses import dataclass
-from distutils.sysconfig import customize_compiler
-from functools import reduce
-from http.client import CannotSendHeader
 from itertools import chain
-from typing import Any, Dict, Generic, Optional, List, Tuple
+from typing import Any, Dict, Generic, List, Set, Tuple
 
-from ._collections import group_by_key
 from ._graph import Graph
 from ._printer import Printer, PrinterOptions
 from ._symbol import Symbol, SymbolType
@@ -52,14 +48,6 @@ class Cursor(Generic[NodeType]):
     target: int
     """Target position for the cursor."""
 
-    def add(self, delta: int):
-        """Return new cursor with current position updated."""
-        return Cursor(
-            node=self.node,
-            current=self.current + delta,
-            target=self.target,
-        )
-
     __slots__ = ('node', 'current', 'target')
 
 
@@ -83,29 +71,6 @@ class Step(Generic[NodeType]):
     symbols: List[Tuple[int, Symbol]]
     """List of symbol and its position in a row."""
 
-    def move_cursor(self, delta: int) -> 'Step[NodeType]':
-        """Return new Step with added position to current."""
-        return Step(
-            cursor=self.cursor.add(delta),
-            symbols=self.symbols,
-        )
-
-    def add_symbols(
-        self, symbols: List[Tuple[int, Symbol]]
-    ) -> 'Step[NodeType]':
-        """Return new Step with added symbols."""
-        return Step(
-            cursor=self.cursor,
-            symbols=self.symbols + symbols,
-        )
-
-    def has_position(self, pos: int) -> bool:
-        """Return whether there is a symbol at the queried position."""
-        for position, _ in self.symbols:
-            if position == pos:
-                return True
-        return False
-
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Step):
             return False
@@ -139,10 +104,15 @@ class Renderer(Generic[NodeType]):
             for height, nodes in height_groups.items()
         }
 
+        defined_sets = {
+            height: set(plan.defined)
+            for height, plan in tracking.items()
+        }
+
         # From the top to the bottom of the graph, compute the paths
         # that are by-passing each level.
-        for height in range(max(height_groups), 1, -1):
-            self._compute_passing_by(Height(height), tracking)
+        for height in range(self.graph.max_height, 1, -1):
+            self._compute_passing_by(Height(height), tracking, defined_sets)
 
         return tracking
 
@@ -150,6 +120,7 @@ class Renderer(Generic[NodeType]):
         self,
         height: Height,
         tracking: Dict[Height, Plan[NodeType]],
+        defined_sets: Dict[Height, Set[NodeType]],
     ) -> None:
         # Compute paths by passing a given height level.
 
@@ -158,30 +129,38 @@ class Renderer(Generic[NodeType]):
 
         current_level = tracking[height]
         next_level = tracking[Height(height-1)]
+        next_defined = defined_sets[Height(height-1)]
+        heights = self.graph.node_heights
+        edges = self.graph.edges
+
+        # Nodes passing by the next level, kept in insertion order.
+        passing_by: Dict[NodeType, None] = {}
 
         for node in current_level.defined:
-            for neighbor in self.graph.edges[node]:
-                if (self.graph.get_node_height(neighbor) < height
-                        and neighbor not in next_level.defined):
+            for neighbor in edges.get(node, ()):
+                if (heights[neighbor] < height
+                        and neighbor not in next_defined):
                     # Path for (node, neighbor) begins in the current
                     # level but will just passing by over the next.
-                    next_level.passing_by.append(node)
+                    passing_by[node] = None
                     break
 
         for node in current_level.passing_by:
-            for neighbor in self.graph.edges[node]:
-                if (self.graph.get_node_height(neighbor) < height
-                        and neighbor not in next_level.defined):
+            for neighbor in edges.get(node, ()):
+                if (heights[neighbor] < height
+                        and neighbor not in next_defined):
                     # Path for (node, neighbor) is passing by the
                     # current level and will continue passing by over
                     # the next level.
-                    next_level.passing_by.append(node)
+                    passing_by[node] = None
                     break
 
+        next_level.passing_by.extend(passing_by)
+
     def _make_cursors(self, planning: Dict[Height, Plan[NodeType]]):
         tracking = {}
 
-        for height in range(max(planning), -1, -1):
+        for height in range(self.graph.max_height, -1, -1):
             height = Height(height)
             if height-1 in planning:
                 tracking[height] = self._make_cursor(
@@ -204,50 +183,46 @@ class Renderer(Generic[NodeType]):
                      next: Plan[NodeType]) -> Cursors[NodeType]:
         # Return list of new path cursors Cursor(node, current, target).
 
+        # Column index of each node in the next level.  Paths passing by
+        # are placed after the defined nodes.
+        next_defined_idx = {node: j for j, node in enumerate(next.defined)}
+        next_passby_idx = {
+            node: j
+            for j, node in enumerate(next.passing_by, len(next.defined))
+        }
+
         # Paths from nodes that are defined in the current level but
         # will be bypassing the next level.
         node_to_passby = []
         for i, node in enumerate(curr.defined):
-            j = len(next.passing_by)
-            for passby_node in next.passing_by:
-                if node == passby_node:
-                    node_to_passby.append(Cursor(node, i*2, j*2))
-                    break
-                j += 1
+            j = next_passby_idx.get(node)
+            if j is not None:
+                node_to_passby.append(Cursor(node, i*2, j*2))
 
         # Paths from nodes that are passing by the current level and
         # will continue passing by the next level.
         passby_to_passby = []
-        i = len(curr.defined)
-        for node in curr.passing_by:
-            j = len(next.defined)
-            for passby_node in next.passing_by:
-                if node == passby_node:
-                    passby_to_passby.append(Cursor(node, i*2, j*2))
-                    break
-                j += 1
-            i += 1
+        for i, node in enumerate(curr.passing_by, len(curr.defined)):
+            j = next_passby_idx.get(node)
+            if j is not None:
+                passby_to_passby.append(Cursor(node, i*2, j*2))
 
         # Paths from nodes that will reach another node in the next level.
         node_to_node = []
         for i, node in enumerate(curr.defined):
             for neighbor in self.graph.edges.get(node, {}):
-                for j, next_node in enumerate(next.defined):
-                    if neighbor == next_node:
-                        node_to_node.append(Cursor(node, i*2, j*2))
-                        break
+                j = next_defined_idx.get(neighbor)
+                if j is not None:
+                    node_to_node.append(Cursor(node, i*2, j*2))
 
         # Paths from nodes that are by passing the current level but
         # will reach the destination node in the next level.
         passby_to_node = []
-        i = len(curr.defined)
-        for node in curr.passing_by:
+        for i, node in enumerate(curr.passing_by, len(curr.defined)):
             for neighbor in self.graph.edges.get(node, {}):
-                for j, next_node in enumerate(next.defined):
-                    if neighbor == next_node:
-                        passby_to_node.append(Cursor(node, i*2, j*2))
-                        break
-            i += 1
+                j = next_defined_idx.get(neighbor)
+                if j is not None:
+                    passby_to_node.append(Cursor(node, i*2, j*2))
 
         cursors: Cursors[NodeType]
         cursors = Cursors(
@@ -259,7 +234,7 @@ class Renderer(Generic[NodeType]):
 
     def _make_canvas(self, cursors_mapping: Dict[Height, Cursors]):
         canvas = []
-        for height in range(max(cursors_mapping), -1, -1):
+        for height in range(self.graph.max_height, -1, -1):
             cursors = cursors_mapping[Height(height)]
             canvas.append(self._draw_cursors(cursors))
             canvas.extend(self._draw_paths(cursors.nodes + cursors.paths))
@@ -268,77 +243,71 @@ class Renderer(Generic[NodeType]):
         return canvas
 
     def _draw_cursors(self, cursors: Cursors[NodeType]) -> List[Symbol]:
-        nodes = {
-            cursor.current: Symbol(
+        symbols: Dict[int, Symbol] = {}
+        max_column = -1
+        for cursor in cursors.nodes:
+            symbols[cursor.current] = Symbol(
                 symbol_type=SymbolType.NODE,
                 label=self.graph.get_node_label(cursor.node),
             )
-            for cursor in cursors.nodes
-        }
-        paths = {
-            cursor.current: Symbol(SymbolType.HOLD)
-            for cursor in cursors.paths
-        }
-        symbols: Dict[int, Symbol] = {}
-        symbols.update(nodes)
-        symbols.update(paths)
-
-        space = Symbol(SymbolType.SPACE)
+            max_column = max(max_column, cursor.current)
+        for cursor in cursors.paths:
+            symbols[cursor.current] = _HOLD
+            max_column = max(max_column, cursor.current)
 
-        row = []
-        for column in range(0, max(symbols)+1):
-            row.append(symbols.get(column, space))
+        row = [_SPACE] * (max_column+1)
+        for column, symbol in symbols.items():
+            row[column] = symbol
 
         return row
 
     def _draw_paths(
         self, cursors: List[Cursor[NodeType]]
     ) -> RenderedGraph:
-        symbols = self._make_symbols(cursors, [])
+        symbols = self._make_symbols(cursors)
         # We may have more than one symbol at a same position, we need
         # to merge those symbols.
-        symbol_mappings = [dict(_merge_symbols(row)) for row in symbols]
-
-        space = Symbol(SymbolType.SPACE)
-
-        rows = [
-            [
-                symbol_mapping.get(column, space)
-                for column in range(0, max(symbol_mapping)+1)
-            ]
-            for symbol_mapping in symbol_mappings
-        ]
+        rows = []
+        for row_symbols in symbols:
+            symbol_mapping, max_column = _merge_symbols(row_symbols)
+            row = [_SPACE] * (max_column+1)
+            for column, symbol in symbol_mapping.items():
+                row[column] = symbol
+            rows.append(row)
 
         return rows
 
     def _make_symbols(
         self,
         cursors: List[Cursor[NodeType]],
-        canvas: List[List[Tuple[int, Symbol]]] = None,
     ) -> List[List[Tuple[int, Symbol]]]:
         # Draw paths getting out of nodes at the current level, each
         # path going to the correct direction.
-        no_changes = all(cursor.current == cursor.target
-                         for cursor in cursors)
-        if no_changes and canvas:
-            return canvas
+        canvas: List[List[Tuple[int, Symbol]]] = []
 
-        if canvas is None:
-            canvas = []
+        # Cursors are moved in place, copy them so that the caller's
+        # cursors are left untouched.
+        cursors = [Cursor(cursor.node, cursor.current, cursor.target)
+                   for cursor in cursors]
 
-        steps = self._move_cursors(cursors)
-        steps = self._move_left(steps)
+        while True:
+            steps = self._move_cursors(cursors)
+            changed = True
+            while changed:
+                steps, changed = _move_left(steps)
 
-        cursors = [step.cursor for step in steps]
-        new_symbols = list(chain(*[step.symbols for step in steps]))
+            canvas.append(list(chain.from_iterable(step.symbols
+                                                   for step in steps)))
 
-        return self._make_symbols(cursors, canvas + [new_symbols])
+            if all(cursor.current == cursor.target for cursor in cursors):
+                return canvas
 
     def _move_cursors(
             self, cursors: List[Cursor[NodeType]]) -> List[Step[NodeType]]:
         # Move cursors to their directions.
         # The direction is determined by comparison of the current
         # column position and the target column.
+        # Cursors are updated in place.
         steps = []
 
         for cursor in cursors:
@@ -349,12 +318,13 @@ class Renderer(Generic[NodeType]):
                 #  \
                 steps.append(
                     Step(
-                        cursor=cursor.add(delta=2),
+                        cursor=cursor,
                         symbols=[
-                            (cursor.current+1, Symbol(SymbolType.RIGHT)),
+                            (cursor.current+1, _RIGHT),
                         ],
                     )
                 )
+                cursor.current += 2
                 continue
 
             if cursor.current > cursor.target:
@@ -364,12 +334,13 @@ class Renderer(Generic[NodeType]):
                 #  /
                 steps.append(
                     Step(
-                        cursor=cursor.add(delta=-2),
+                        cursor=cursor,
                         symbols=[
-                            (cursor.current-1, Symbol(SymbolType.LEFT)),
+                            (cursor.current-1, _LEFT),
                         ],
                     )
                 )
+                cursor.current -= 2
                 continue
 
             # Path goes down straight.
@@ -380,113 +351,133 @@ class Renderer(Generic[NodeType]):
                 Step(
                     cursor=cursor,
                     symbols=[
-                        (cursor.current, Symbol(SymbolType.HOLD)),
+                        (cursor.current, _HOLD),
                     ],
                 )
             )
 
         return steps
 
-    def _move_left(self, steps: List[Step[NodeType]]):
-        new_steps = _move_left(steps)
-        while steps != new_steps:
-            steps = new_steps
-            new_steps = _move_left(steps)
-        return new_steps
-
 
-def _move_left(steps: List[Step[NodeType]]) -> List[Step[NodeType]]:
-    new_steps: List[Step[NodeType]] = list()
+def _move_left(
+    steps: List[Step[NodeType]],
+) -> Tuple[List[Step[NodeType]], bool]:
+    # Move cursors one step to the left where there is room for it.
+    # Steps are updated in place.  Returns the steps and whether any
+    # cursor has moved.
+    changed = False
+
+    # Index the first step with a symbol at each position.  Symbols
+    # added during this pass are not indexed.
+    pos_index: Dict[int, Step[NodeType]] = {}
+    for step in steps:
+        for position, _ in step.symbols:
+            pos_index.setdefault(position, step)
 
     for step in steps:
-        current = step.cursor.current
-        if current <= step.cursor.target:
-            new_steps.append(step)
+        cursor = step.cursor
+        current = cursor.current
+        if current <= cursor.target:
             continue
 
         # Needs to move to left direction.
-        step_curr = _find_step(steps, position=current)
-        step_left = _find_step(steps, position=current-1)
+        step_curr = pos_index.get(current)
+        step_left = pos_index.get(current-1)
 
         if not step_curr and not step_left:
             # Nothing at current position or current-1 position, so
             # we fill the spaces "  /" as "__/", moving the cursor
             # accordingly.
-            new_steps.append(
-                step
-                .move_cursor(
-                    delta=-2
-                ).add_symbols([
-                    (current-1, Symbol(SymbolType.LEFT_MOVE)),
-                    (current, Symbol(SymbolType.LEFT_MOVE)),
-                ])
-            )
+            changed = True
+            cursor.current -= 2
+            step.symbols.extend([
+                (current-1, _LEFT_MOVE),
+                (current, _LEFT_MOVE),
+            ])
             continue
 
         if not step_curr and step_left:
-            if step_left.cursor.target != step.cursor.target:
-                new_steps.append(step)
+            if step_left.cursor.target != cursor.target:
                 continue
 
-            new_steps.append(
-                step
-                .move_cursor(
-                    delta=-2
-                ).add_symbols([
-                    (current, Symbol(SymbolType.LEFT_MOVE)),
-                ])
-            )
+            changed = True
+            cursor.current -= 2
+            step.symbols.append((current, _LEFT_MOVE))
             continue
 
         if not step_curr:
             raise RuntimeError('unexpected error')
 
-        if step_curr.cursor.target != step.cursor.target:
-            new_steps.append(step)
+        if step_curr.cursor.target != cursor.target:
             continue
 
-        new_steps.append(step.move_cursor(delta=-2))
-
-    return new_steps
+        changed = True
+        cursor.current -= 2
 
-
-def _find_step(
-    steps: List[Step[NodeType]],
-    position: int,
-) -> Optional[Step[NodeType]]:
-    # Return the first step with a symbol at a request position.
-    for step in steps:
-        if step.has_position(position):
-            return step
-    return None
+    return steps, changed
 
 
 def _merge_symbols(
     symbols: List[Tuple[int, Symbol]]
-) -> List[Tuple[int, Symbol]]:
-    return [
-        (key, reduce(_resolve_conflict, group))
-        for key, group in group_by_key(symbols)
-    ]
+) -> Tuple[Dict[int, Symbol], int]:
+    # Return the merged symbol at each position and the last position.
+    merged: Dict[int, Symbol] = {}
+    max_column = -1
+    for column, symbol in symbols:
+        if column in merged:
+            merged[column] = _resolve_conflict(merged[column], symbol)
+        else:
+            merged[column] = symbol
+            if column > max_column:
+                max_column = column
+    return merged, max_column
 
 
 def _resolve_conflict(a: Symbol, b: Symbol) -> Symbol:
     # Given two symbols a and b at the same position, we return the
     # symbol that represents both at the same time.
-    if a.is_node:
+    resolved = _RESOLVED_TYPE[a.symbol_type, b.symbol_type]
+    if resolved is a.symbol_type:
         return a
-    if b.is_node:
+    if resolved is b.symbol_type:
         return b
-    if b.is_space:
+    return _CROSS
+
+
+def _resolve_conflict_type(a: SymbolType, b: SymbolType) -> SymbolType:
+    # Return the symbol type representing both a and b.
+    def is_left_or_right(t: SymbolType) -> bool:
+        return t in (SymbolType.LEFT, SymbolType.RIGHT)
+
+    if a is SymbolType.NODE:
         return a
-    if a.is_space:
+    if b is SymbolType.NODE:
         return b
-    if a.is_left and b.is_right:
-        return Symbol(SymbolType.CROSS)
-    if a.is_right and b.is_left:
-        return Symbol(SymbolType.CROSS)
-    if a.is_cross and (b.is_left or b.is_right):
-        return Symbol(SymbolType.CROSS)
-    if b.is_cross and (a.is_left or a.is_right):
-        return Symbol(SymbolType.CROSS)
+    if b is SymbolType.SPACE:
+        return a
+    if a is SymbolType.SPACE:
+        return b
+    if a is SymbolType.LEFT and b is SymbolType.RIGHT:
+        return SymbolType.CROSS
+    if a is SymbolType.RIGHT and b is SymbolType.LEFT:
+        return SymbolType.CROSS
+    if a is SymbolType.CROSS and is_left_or_right(b):
+        return SymbolType.CROSS
+    if b is SymbolType.CROSS and is_left_or_right(a):
+        return SymbolType.CROSS
     return a
+
+
+_RESOLVED_TYPE: Dict[Tuple[SymbolType, SymbolType], SymbolType] = {
+    (a, b): _resolve_conflict_type(a, b)
+    for a in SymbolType
+    for b in SymbolType
+}
+"""Symbol type resolving a conflict for each pair of symbol types."""
+
+_CROSS = Symbol.blank(SymbolType.CROSS)
+_HOLD = Symbol.blank(SymbolType.HOLD)
+_LEFT = Symbol.blank(SymbolType.LEFT)
+_LEFT_MOVE = Symbol.blank(SymbolType.LEFT_MOVE)
+_RIGHT = Symbol.blank(SymbolType.RIGHT)
+_SPACE = Symbol.blank(SymbolType.SPACE)
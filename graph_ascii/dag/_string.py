@@ -7,25 +7,31 @@ def longest_common_prefix(items: List[str]) -> str:
     if not items:
         return ''
 
-    current = items[0]
+    # The common prefix of all items is the common prefix of the
+    # lexicographically smallest and largest items.
+    lo, hi = min(items), max(items)
 
-    for i in range(1, len(items)):
-        if not current:
+    i = 0
+    for a, b in zip(lo, hi):
+        if a != b:
             break
+        i += 1
 
-        new_prefix = ''
-
-        for j in range(len(items[i])):
-            if j < len(current) and current[j] == items[i][j]:
-                new_prefix += current[j]
-            else:
-                break
-
-        current = new_prefix
-
-    return current
+    return lo[:i]
 
 
 def longest_common_suffix(items: List[str]) -> str:
     """Return the longest common suffix of a list of strings."""
-    return longest_common_prefix([item[::-1] for item in items])[::-1]
+    if not items:
+        return ''
+
+    # Walk all items backwards at once with reverse iterators, so no
+    # reversed copy of the items is allocated.
+    i = 0
+    for chars in zip(*(reversed(item) for item in items)):
+        if chars.count(chars[0]) != len(chars):
+            break
+        i += 1
+
+    first = items[0]
+    return first[len(first)-i:]
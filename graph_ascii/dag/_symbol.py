@@ -1,38 +1,36 @@
 """Symbol definitions."""
-from dataclasses import dataclass
-from enum import Enum, auto
+from enum import Enum
 from typing import Dict, Final
 
 
 class SymbolType(Enum):
     """SymbolType represents the a unit of information to be output."""
 
-    CROSS = auto()       # Crossing paths.
-    HOLD = auto()        # Straight path.
-    LEFT = auto()        # Path going down to the left direction.
-    LEFT_MOVE = auto()   # Path going to the left at the same level.
-    NODE = auto()        # A node in the path.
-    RIGHT = auto()       # Path going down to the right direction.
-    RIGHT_MOVE = auto()  # Path going to the right at the same level.
-    SPACE = auto()       # White space.
+    CROSS = (1, 'x')        # Crossing paths.
+    HOLD = (2, '|')         # Straight path.
+    LEFT = (3, '/')         # Path going down to the left direction.
+    LEFT_MOVE = (4, '_')    # Path going to the left at the same level.
+    NODE = (5, 'o')         # A node in the path.
+    RIGHT = (6, '\\')       # Path going down to the right direction.
+    RIGHT_MOVE = (7, '_')   # Path going to the right at the same level.
+    SPACE = (8, ' ')        # White space.
+
+    char: str
+    """Character that represents the symbol type."""
+
+    def __new__(cls, value: int, char: str) -> 'SymbolType':
+        # Members are defined as (value, char), the value alone
+        # identifies the member, so types sharing a character are not
+        # aliases of each other.
+        member = object.__new__(cls)
+        member._value_ = value
+        member.char = char
+        return member
 
     def to_char(self) -> str:
-        return _SYMBOL_CHAR[self]
-
-
-_SYMBOL_CHAR: Final[Dict[SymbolType, str]] = {
-    SymbolType.CROSS: 'x',
-    SymbolType.HOLD: '|',
-    SymbolType.LEFT: '/',
-    SymbolType.LEFT_MOVE: '_',
-    SymbolType.NODE: 'o',
-    SymbolType.RIGHT: '\\',
-    SymbolType.RIGHT_MOVE: '_',
-    SymbolType.SPACE: ' ',
-}
+        return self.char
 
 
-@dataclass
 class Symbol:
     """Symbol is a symbol to be output.
 
@@ -42,56 +40,42 @@ class Symbol:
     def __init__(self, symbol_type: SymbolType, label: str = '') -> None:
         self.symbol_type = symbol_type
         self.label = label
-
-    @property
-    def is_cross(self) -> bool:
-        return self.is_type(SymbolType.CROSS)
-
-    @property
-    def is_hold(self) -> bool:
-        return self.is_type(SymbolType.HOLD)
-
-    @property
-    def is_left(self) -> bool:
-        return self.is_type(SymbolType.LEFT)
-
-    @property
-    def is_left_move(self) -> bool:
-        return self.is_type(SymbolType.LEFT_MOVE)
-
-    @property
-    def is_node(self) -> bool:
-        return self.is_type(SymbolType.NODE)
-
-    @property
-    def is_right(self) -> bool:
-        return self.is_type(SymbolType.RIGHT)
-
-    @property
-    def is_right_move(self) -> bool:
-        return self.is_type(SymbolType.RIGHT_MOVE)
-
-    @property
-    def is_space(self) -> bool:
-        return self.is_type(SymbolType.SPACE)
-
-    def is_type(self, symbol_type: SymbolType) -> bool:
-        return self.symbol_type == symbol_type
+        self.char = symbol_type.char
+        self._hash = hash((symbol_type, label))
+        if label:
+            self._repr = f'{symbol_type.name}({label!r})'
+        else:
+            self._repr = symbol_type.name
+
+    @classmethod
+    def blank(cls, symbol_type: SymbolType) -> 'Symbol':
+        """Return the shared symbol of a type without a label.
+
+        Symbols are never modified, so a single instance of each
+        label-less symbol can be shared instead of allocating new ones.
+        """
+        return _BLANK_SYMBOLS[symbol_type]
 
     def to_char(self) -> str:
-        return self.symbol_type.to_char()
+        return self.char
 
     def __eq__(self, b: object) -> bool:
-        if not isinstance(b, Symbol):
-            return False
-        return self.symbol_type == b.symbol_type and self.label == b.label
+        if b is self:
+            return True
+        if b.__class__ is not Symbol:
+            return NotImplemented
+        return self.symbol_type is b.symbol_type and self.label == b.label
 
     def __hash__(self):
-        return hash(self.symbol_type) + hash(self.label)
+        return self._hash
 
     def __repr__(self):
-        if self.label:
-            return f'{self.symbol_type.name}({self.label!r})'
-        return self.symbol_type.name
+        return self._repr
 
-    __slots__ = ('symbol_type', 'label')
+    __slots__ = ('symbol_type', 'label', 'char', '_hash', '_repr')
+
+
+_BLANK_SYMBOLS: Final[Dict[SymbolType, Symbol]] = {
+    symbol_type: Symbol(symbol_type)
+    for symbol_type in SymbolType
+}
@@ -1,5 +1,5 @@
-from collections import defaultdict
-import re
+from itertools import groupby
+from operator import itemgetter
 
 import tensorflow as tf
 
@@ -12,16 +12,26 @@ def render_from_tensorflow_graph(graph: tf.Graph) -> str:
     graph_def = graph.as_graph_def()
 
     nodes: Nodes[str] = {}
-    edges: Edges[str] = defaultdict(set)
+    # Pairs of (input, output) node names, grouped into edges below.
+    pairs = []
 
     for node in graph_def.node:
         output_name = node.name
         nodes[output_name] = output_name
 
         for input_full_name in node.input:
-            parts = input_full_name.split(':')
-            input_name = re.sub(r'^/^', '', parts[0])
-            edges[input_name].add(output_name)
+            # Inputs are named `name:output_index`, and control
+            # dependencies are prefixed with `^`.
+            input_name, _, _ = input_full_name.partition(':')
+            if input_name.startswith('^'):
+                input_name = input_name[1:]
+            pairs.append((input_name, output_name))
+
+    pairs.sort()
+    edges: Edges[str] = {
+        input_name: {pair[1] for pair in group}
+        for input_name, group in groupby(pairs, key=itemgetter(0))
+    }
 
     dag = Graph(nodes=nodes, edges=edges)
     renderer = Renderer(graph=dag)
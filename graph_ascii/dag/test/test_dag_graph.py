@@ -10,10 +10,13 @@ The sample_graph in these tests is the following:
     |
     o          L5             3          0
 """
-from random import shuffle
-from typing import Iterator, Tuple
+from random import sample
+from typing import Dict, Iterator, List, Tuple
+from unittest.mock import patch
 
-from graph_ascii.dag._graph import Graph
+import pytest
+
+from graph_ascii.dag._graph import Graph, _heights_from
 
 
 def sample_graph() -> Graph[int]:
@@ -22,22 +25,19 @@ def sample_graph() -> Graph[int]:
 
 def sample_graphs() -> Iterator[Tuple[Graph[int], Graph[int]]]:
     """Generate the same graph shuffling the dictionary ordering."""
-    for _ in range(100):
-        nodes = list(SAMPLE_NODES.items())
-        shuffle(nodes)
-
-        edges = list(SAMPLE_EDGES.items())
-        shuffle(edges)
-
-        reverse_edges = list(REVERSE_SAMPLE_EDGES.items())
-        shuffle(reverse_edges)
-
+    for _ in range(20):
+        nodes = _shuffled(_SAMPLE_NODES_ITEMS)
         yield (
-            Graph(nodes=dict(nodes), edges=dict(edges)),
-            Graph(nodes=dict(nodes), edges=dict(reverse_edges)),
+            Graph(nodes=nodes, edges=_shuffled(_SAMPLE_EDGES_ITEMS)),
+            Graph(nodes=dict(nodes),
+                  edges=_shuffled(_REVERSE_SAMPLE_EDGES_ITEMS)),
         )
 
 
+def _shuffled(items: List[Tuple]) -> Dict:
+    return dict(sample(items, len(items)))
+
+
 def test_dag_graph():
     for graph, reverse_graph in sample_graphs():
         reverse_graph = graph.reverse_edges()
@@ -45,11 +45,42 @@ def test_dag_graph():
 
         assert graph.node_heights == NODE_HEIGHTS
         assert reverse_graph.node_heights == REVERSE_NODE_HEIGHTS
+        assert graph.reverse_node_heights == REVERSE_NODE_HEIGHTS
 
         unnamed_graph = Graph(nodes={}, edges=graph.edges)
         assert unnamed_graph.nodes == {i: '' for i in range(8)}
 
         assert graph.height_groups == HEIGHT_GROUPS
+        assert graph.max_height == 3
+
+
+def test_dag_graph_heights_computed_once():
+    graph = sample_graph()
+    with patch('graph_ascii.dag._graph._heights_from',
+               wraps=_heights_from) as heights_from:
+        for _ in range(3):
+            graph.height_groups
+            graph.max_height
+            graph.node_heights
+            graph.reverse_node_heights
+
+    # One walk for the node heights and one for the reverse heights.
+    walked_edges = [call.args[1] for call in heights_from.call_args_list]
+    assert walked_edges == [graph.edges, graph._reverse_adjacency]
+
+
+def test_dag_graph_height_ties():
+    # Nodes of the same height keep the order the walk reached them.
+    graph = Graph(nodes={0: 'a', 2: 'x', 3: 'x', 1: 'b'},
+                  edges={0: {3}, 1: {2}})
+    assert list(graph.node_heights) == [3, 0, 2, 1]
+    assert graph.height_groups == {0: [3, 2], 1: [0, 1]}
+
+
+def test_dag_graph_cycle():
+    graph = Graph(nodes={}, edges={0: {1}, 1: {2}, 2: {0}})
+    with pytest.raises(ValueError, match='cycle'):
+        graph.node_heights
 
 
 SAMPLE_NODES = {i: f'L{i}' for i in range(8)}
@@ -70,6 +101,10 @@ REVERSE_SAMPLE_EDGES = {
     5: {3},
 }
 
+_SAMPLE_NODES_ITEMS = list(SAMPLE_NODES.items())
+_SAMPLE_EDGES_ITEMS = list(SAMPLE_EDGES.items())
+_REVERSE_SAMPLE_EDGES_ITEMS = list(REVERSE_SAMPLE_EDGES.items())
+
 NODE_HEIGHTS = {0: 3, 1: 3, 2: 2, 3: 1, 4: 2, 5: 0, 6: 2, 7: 2}
 REVERSE_NODE_HEIGHTS = {0: 0, 1: 0, 2: 1, 3: 2, 4: 0, 5: 3, 6: 0, 7: 0}
 
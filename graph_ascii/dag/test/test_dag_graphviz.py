@@ -1,12 +1,35 @@
-from typing import Final, List
+from functools import cached_property, lru_cache
+from io import StringIO
+from typing import Final, Tuple
 import os
 
-from graph_ascii.dag.graphviz import render_from_dot_filename
+import pytest
+
+from graph_ascii.dag._graphviz import _scan_dot
+from graph_ascii.dag.graphviz import (
+    render_from_dot_file,
+    render_from_dot_filename,
+)
 
 
 def test_dag_graphviz():
     for case in GRAPHVIZ_TEST_CASES:
         assert render_from_dot_filename(case.input) == case.output_content
+        assert (render_from_dot_filename(case.input, use_fast_parser=False)
+                == case.output_content)
+
+
+def test_dag_graphviz_dot_syntax():
+    for dot, expected in DOT_SYNTAX_TEST_CASES:
+        assert render_from_dot_file(StringIO(dot)) == expected
+        assert (render_from_dot_file(StringIO(dot), use_fast_parser=False)
+                == expected)
+
+
+def test_dag_graphviz_scan_dot_unsupported():
+    for dot in UNSUPPORTED_DOT_TEST_CASES:
+        with pytest.raises(ValueError):
+            _scan_dot(dot)
 
 
 class GraphvizTestCase:
@@ -16,10 +39,19 @@ class GraphvizTestCase:
         self.name = name
         self.input = os.path.join(dirname, input)
         self.output = os.path.join(dirname, output)
-        self.output_content = open(self.output, 'rt').read()
 
+    @cached_property
+    def output_content(self) -> str:
+        return _read(self.output)
 
-GRAPHVIZ_TEST_CASES: Final[List[GraphvizTestCase]] = [
+
+@lru_cache(maxsize=None)
+def _read(path: str) -> str:
+    with open(path, 'rt') as f:
+        return f.read()
+
+
+GRAPHVIZ_TEST_CASES: Final[Tuple[GraphvizTestCase, ...]] = (
     GraphvizTestCase(
         name='Case 1',
         input='data/test.dot',
@@ -35,4 +67,51 @@ GRAPHVIZ_TEST_CASES: Final[List[GraphvizTestCase]] = [
         input='data/inception_v3.dot',
         output='data/inception_v3.txt',
     ),
-]
+)
+
+
+def graph_as_string(*args: str) -> str:
+    return '\n'.join((*args, ''))
+
+
+DOT_SYNTAX_TEST_CASES: Final[Tuple[Tuple[str, str], ...]] = (
+    (
+        'graph G { a -- b; }',
+        graph_as_string('o', '|', 'o'),
+    ),
+    (
+        'digraph { a [label="x]y"]; a -> b }',
+        graph_as_string('o    x]y', '|', 'o'),
+    ),
+    (
+        'digraph { a [label="A"] b [label="B"] a -> b }',
+        graph_as_string('o    A', '|', 'o    B'),
+    ),
+    (
+        'digraph { a:p1 -> b:p2 }',
+        graph_as_string('o', '|', 'o'),
+    ),
+    (
+        'digraph { a [tooltip="label=bad", label=ok]; a -> b }',
+        graph_as_string('o    ok', '|', 'o'),
+    ),
+    (
+        'digraph { a [label="long\\\nlabel"]; a -> b }',
+        graph_as_string('o    longlabel', '|', 'o'),
+    ),
+    (
+        'digraph { a [label="long\\\r\nlabel"]; a -> b }',
+        graph_as_string('o    longlabel', '|', 'o'),
+    ),
+)
+
+UNSUPPORTED_DOT_TEST_CASES: Final[Tuple[str, ...]] = (
+    'graph G { a -- b; }',
+    'digraph { a -- b; }',
+    'digraph { a:p1 -> b:p2 }',
+    'digraph { a -> { b c } }',
+    'digraph { subgraph s { a [label=x] } }',
+    'digraph { node [label=x]; a -> b }',
+    'digraph { a [label=<<b>a</b>>] }',
+    'digraph { a -> b } digraph { c -> d }',
+)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Final, List
+from typing import Final, List, Tuple
 
 from graph_ascii.dag._printer import Printer, PrinterOptions, Spacing
 from graph_ascii.dag._symbol import Symbol, SymbolType
@@ -20,19 +20,19 @@ class _TestCase:
 
 
 def _output(items: List[str]) -> str:
-    return '\n'.join(items) + '\n'
+    return '\n'.join((*items, ''))
 
 
-NODE = Symbol(SymbolType.NODE)
-HOLD = Symbol(SymbolType.HOLD)
-LEFT = Symbol(SymbolType.LEFT)
-RIGHT = Symbol(SymbolType.RIGHT)
-LEFT_MOVE = Symbol(SymbolType.LEFT_MOVE)
-RIGHT_MOVE = Symbol(SymbolType.RIGHT_MOVE)
-CROSS = Symbol(SymbolType.CROSS)
-SPACE = Symbol(SymbolType.SPACE)
+NODE = Symbol.blank(SymbolType.NODE)
+HOLD = Symbol.blank(SymbolType.HOLD)
+LEFT = Symbol.blank(SymbolType.LEFT)
+RIGHT = Symbol.blank(SymbolType.RIGHT)
+LEFT_MOVE = Symbol.blank(SymbolType.LEFT_MOVE)
+RIGHT_MOVE = Symbol.blank(SymbolType.RIGHT_MOVE)
+CROSS = Symbol.blank(SymbolType.CROSS)
+SPACE = Symbol.blank(SymbolType.SPACE)
 
-TEST_CASES: Final[List[_TestCase]] = [
+TEST_CASES: Final[Tuple[_TestCase, ...]] = (
     _TestCase(
         rendered_graph=[
             [NODE],
@@ -194,4 +194,4 @@ TEST_CASES: Final[List[_TestCase]] = [
             spaces=20,
         ),
     ),
-]
+)
@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+import copy
+from dataclasses import dataclass, field
 from functools import partial
-from typing import Dict, Final, Generic, List, Tuple
+from typing import Dict, Final, FrozenSet, Generic, List, Tuple
 
 from graph_ascii.dag import Graph, Renderer
 from graph_ascii.dag._render import Plan, Cursor, Cursors, Step, _move_left
@@ -42,20 +43,19 @@ def test_dag_render_make_symbols():
             cursors=case.cursors,
         )
 
-        result_sets = [set(x) for x in sparse_rendered_paths]
-        expected_sets = [set(x) for x in case.symbols]
+        result_sets = [frozenset(x) for x in sparse_rendered_paths]
 
-        if not result_sets == expected_sets:
+        if not result_sets == case.expected_sets:
             print('Case Description:', case.description)
             print('Sparse Rendered Paths:', sparse_rendered_paths)
             print('Expected Rendered Paths:', case.symbols)
 
-        assert result_sets == expected_sets
+        assert result_sets == case.expected_sets
 
 
 def test_dag_render_move_left():
     for case in MOVE_LEFT_TEST_CASES:
-        new_steps = _move_left(case.steps)
+        new_steps, _ = _move_left(copy.deepcopy(case.steps))
 
         if not new_steps == case.new_steps:
             print('Case Description:', case.description)
@@ -99,6 +99,12 @@ class _MakeSymbolsTestCase(Generic[NodeType]):
     symbols: List[List[Tuple[int, Symbol]]]
     """Expected sparse rendered path"""
 
+    expected_sets: List[FrozenSet[Tuple[int, Symbol]]] = field(init=False)
+    """Expected sparse rendered path, as sets of symbols for each row."""
+
+    def __post_init__(self) -> None:
+        self.expected_sets = [frozenset(x) for x in self.symbols]
+
 
 @dataclass
 class _MoveLeftTestCase(Generic[NodeType]):
@@ -114,25 +120,25 @@ class _MoveLeftTestCase(Generic[NodeType]):
 
 
 def description(*args: str) -> str:
-    return '\n'.join([*args, ''])
+    return '\n'.join((*args, ''))
 
 
 def graph_as_string(*args: str) -> str:
-    return '\n'.join([*args, ''])
+    return '\n'.join((*args, ''))
 
 
 Node = partial(Symbol, SymbolType.NODE)
 
 
-CROSS = Symbol(SymbolType.CROSS)
-HOLD = Symbol(SymbolType.HOLD)
-LEFT = Symbol(SymbolType.LEFT)
-LEFT_MOVE = Symbol(SymbolType.LEFT_MOVE)
-NODE = Symbol(SymbolType.NODE)
-RIGHT = Symbol(SymbolType.RIGHT)
-SPACE = Symbol(SymbolType.SPACE)
+CROSS = Symbol.blank(SymbolType.CROSS)
+HOLD = Symbol.blank(SymbolType.HOLD)
+LEFT = Symbol.blank(SymbolType.LEFT)
+LEFT_MOVE = Symbol.blank(SymbolType.LEFT_MOVE)
+NODE = Symbol.blank(SymbolType.NODE)
+RIGHT = Symbol.blank(SymbolType.RIGHT)
+SPACE = Symbol.blank(SymbolType.SPACE)
 
-RENDER_TEST_CASES: Final[List[_RenderTestCase]] = [
+RENDER_TEST_CASES: Final[Tuple[_RenderTestCase, ...]] = (
     _RenderTestCase(
         graph=Graph(nodes={}, edges={0: {1, 2}, 1: {2}}),
         height_groups={
@@ -336,9 +342,54 @@ RENDER_TEST_CASES: Final[List[_RenderTestCase]] = [
             'o          L5',
         ),
     ),
-]
+    _RenderTestCase(
+        graph=Graph(nodes={}, edges={0: {1, 3}, 1: {3}, 2: {3}}),
+        height_groups={
+            Height(2): [0],
+            Height(1): [1, 2],
+            Height(0): [3],
+        },
+        plan={
+            Height(2): Plan(defined=[0], passing_by=[]),
+            Height(1): Plan(defined=[1, 2], passing_by=[0]),
+            Height(0): Plan(defined=[3], passing_by=[]),
+        },
+        cursors={
+            Height(2): Cursors(
+                nodes=[Cursor(node=0, current=0, target=0),
+                       Cursor(node=0, current=0, target=4)],
+                paths=[],
+            ),
+            Height(1): Cursors(
+                nodes=[Cursor(node=1, current=0, target=0),
+                       Cursor(node=2, current=2, target=0)],
+                paths=[Cursor(node=0, current=4, target=0)],
+            ),
+            Height(0): Cursors(
+                nodes=[Cursor(node=3, current=0, target=0)],
+                paths=[],
+            ),
+        },
+        canvas=[
+            [NODE],
+            [HOLD, RIGHT],
+            [HOLD, SPACE, SPACE, RIGHT],
+            [NODE, SPACE, NODE, SPACE, HOLD],
+            [HOLD, LEFT, LEFT_MOVE, LEFT],
+            [NODE],
+        ],
+        as_string=graph_as_string(
+            'o',
+            '|\\',
+            '|  \\',
+            'o o |',
+            '|/_/',
+            'o',
+        ),
+    ),
+)
 
-MAKE_SYMBOLS_TEST_CASES: Final[List[_MakeSymbolsTestCase]] = [
+MAKE_SYMBOLS_TEST_CASES: Final[Tuple[_MakeSymbolsTestCase, ...]] = (
     _MakeSymbolsTestCase(
         description=description(
             'Single node to the right.',
@@ -419,9 +470,9 @@ MAKE_SYMBOLS_TEST_CASES: Final[List[_MakeSymbolsTestCase]] = [
             [(0, Symbol(SymbolType.HOLD)), (3, Symbol(SymbolType.RIGHT))],
         ]
     ),
-]
+)
 
-MOVE_LEFT_TEST_CASES: Final[List[_MoveLeftTestCase]] = [
+MOVE_LEFT_TEST_CASES: Final[Tuple[_MoveLeftTestCase, ...]] = (
     _MoveLeftTestCase(
         description=description(
             'Three paths, one with left move.',
@@ -497,4 +548,4 @@ MOVE_LEFT_TEST_CASES: Final[List[_MoveLeftTestCase]] = [
                           (3, Symbol(SymbolType.LEFT))]),
         ],
     ),
-]
+)
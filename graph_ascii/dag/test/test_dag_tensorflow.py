@@ -15,9 +15,30 @@ def test_dag_tensorflow():
     assert output == _EXPECTED
 
 
+def test_dag_tensorflow_control_dependencies():
+    g = tf.Graph()
+    with g.as_default():
+        a = tf.constant(1, name='a')
+        _ = tf.constant(2, name='b')
+        with g.control_dependencies([a]):
+            _ = tf.constant(3, name='c')
+
+    output = render_from_tensorflow_graph(g)
+
+    # The control input `^a` is drawn as an edge from node a.
+    assert output == _EXPECTED_CONTROL_DEPENDENCIES
+
+
 _EXPECTED = '\n'.join([
     'o o    a,b',
     '|/',
     'o      c',
     '',
 ])
+
+_EXPECTED_CONTROL_DEPENDENCIES = '\n'.join([
+    'o      a',
+    '|',
+    'o o    c,b',
+    '',
+])